@@ -33,7 +33,8 @@ class AgentManager:
         self,
         room_name: str,
         livekit_token: str,
-        event_callback: Optional[Callable] = None
+        event_callback: Optional[Callable] = None,
+        on_exit: Optional[Callable] = None
     ) -> bool:
         """
         Start an agent for a room
@@ -42,6 +43,7 @@ class AgentManager:
             room_name: Name of the room
             livekit_token: Agent access token
             event_callback: Async callback for events
+            on_exit: Async callback run once the agent has finished, failed or been stopped
 
         Returns:
             True if agent started successfully, False otherwise
@@ -56,7 +58,8 @@ class AgentManager:
                 self._run_agent_wrapper(
                     room_name=room_name,
                     livekit_token=livekit_token,
-                    event_callback=event_callback
+                    event_callback=event_callback,
+                    on_exit=on_exit
                 )
             )
 
@@ -79,7 +82,8 @@ class AgentManager:
         self,
         room_name: str,
         livekit_token: str,
-        event_callback: Optional[Callable]
+        event_callback: Optional[Callable],
+        on_exit: Optional[Callable] = None
     ):
         """Wrapper to run agent and handle errors"""
         try:
@@ -119,6 +123,13 @@ class AgentManager:
                 except Exception:
                     pass
 
+        finally:
+            if on_exit:
+                try:
+                    await on_exit()
+                except Exception as e:
+                    logger.error(f"❌ Agent exit callback failed for room {room_name}: {e}")
+
     async def stop_agent(self, room_name: str) -> bool:
         """
         Stop an agent for a room
@@ -0,0 +1,107 @@
+"""
+Event Batcher - Coalesces room events before fanning them out to SSE clients
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RoomBatcher:
+    """
+    Batches events for a single room and publishes them to SSE subscribers
+
+    Producers call publish() with an already-encoded payload, without awaiting.
+    A single consumer task collects up to max_batch_size events (or waits at
+    most max_delay_seconds) and pushes the whole batch to every subscriber queue.
+    """
+
+    def __init__(
+        self,
+        room_name: str,
+        subscribers: Dict[str, Dict[int, asyncio.Queue]],
+        max_batch_size: int = 32,
+        max_delay_seconds: float = 0.05,
+        max_pending: int = 1024
+    ):
+        """
+        Initialize batcher and start its consumer task
+
+        Args:
+            room_name: Name of the room whose events are batched
+            subscribers: Mapping of room_name -> {client_id: subscriber queue}
+            max_batch_size: Flush as soon as this many events are pending
+            max_delay_seconds: Maximum time an event waits before a flush
+            max_pending: Capacity of the input queue
+        """
+        self.room_name = room_name
+        self.subscribers = subscribers
+        self.max_batch_size = max_batch_size
+        self.max_delay_seconds = max_delay_seconds
+
+        self.input_queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task = asyncio.create_task(self._run())
+
+    def publish(self, event_type: str, payload: str, seq: Optional[int] = None) -> None:
+        """
+        Queue an event for the next batch
+
+        Args:
+            event_type: SSE event name (transcript, evaluation, status, ...)
+            payload: JSON-encoded event data
+            seq: Room backlog sequence number (None for events not kept in the backlog)
+        """
+        try:
+            self.input_queue.put_nowait((event_type, payload, seq))
+        except asyncio.QueueFull:
+            logger.warning(f"⚠️ Event queue full for room {self.room_name} - dropping event")
+
+    async def _run(self):
+        """Collect events into batches and flush them (None on the queue stops the task)"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            event = await self.input_queue.get()
+            if event is None:
+                return
+
+            batch = [event]
+            deadline = loop.time() + self.max_delay_seconds
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self.input_queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if event is None:
+                    self._flush(batch)
+                    return
+                batch.append(event)
+
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[str, str, Optional[int]]]) -> None:
+        """Push a batch to every subscriber"""
+        queues = self.subscribers.get(self.room_name)
+        if not queues:
+            return
+
+        for queue in list(queues.values()):
+            queue.put_nowait(batch)
+
+    async def close(self):
+        """Flush pending events and stop the consumer task"""
+        try:
+            self.input_queue.put_nowait(None)
+        except asyncio.QueueFull:
+            self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
@@ -6,10 +6,16 @@ Uses Anthropic Claude to analyze interview transcripts in real-time
 Based on Hugo's comprehensive Quant Finance topic taxonomy
 """
 
+import asyncio
+import hashlib
 import logging
 import json
+import os
+import time
+from collections import OrderedDict
 from datetime import datetime
-from anthropic import Anthropic
+from typing import Dict, Optional, Tuple
+from anthropic import AsyncAnthropic
 
 from audio_pipeline.models import (
     BufferedWindow,
@@ -37,6 +43,70 @@ QUANT_THEMES = {
     "[EXTRA]": "Off-topic questions, greetings, transitions, questions about the job."
 }
 
+# Themes formatted for the prompt (static, built once)
+THEMES_LIST = "\n".join(f"{tag}: {desc}" for tag, desc in QUANT_THEMES.items())
+
+
+# Default maximum number of Claude evaluation calls in flight across all rooms
+# (overridden by ANTHROPIC_MAX_INFLIGHT, read when the semaphore is created)
+MAX_CONCURRENT_EVALUATIONS = 8
+
+_evaluation_semaphore: Optional[asyncio.Semaphore] = None
+
+# Number of Claude responses kept for identical conversation windows, and for how long
+MAX_CACHED_RESPONSES = 256
+RESPONSE_CACHE_TTL_SECONDS = 3600
+
+# blake2b(model + conversation) -> (monotonic expiry, raw response text), in LRU order
+_response_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+# Shared Anthropic clients: api_key -> AsyncAnthropic
+_anthropic_clients: Dict[str, AsyncAnthropic] = {}
+
+
+def get_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """
+    Get the shared Anthropic client for an API key
+
+    Created on first use and reused by every evaluator, so all rooms share
+    one HTTP connection pool instead of opening one per agent.
+    """
+    client = _anthropic_clients.get(api_key)
+    if client is None:
+        client = AsyncAnthropic(api_key=api_key)
+        _anthropic_clients[api_key] = client
+    return client
+
+
+async def close_anthropic_clients() -> None:
+    """Close the shared Anthropic clients and their connection pools"""
+    clients = list(_anthropic_clients.values())
+    _anthropic_clients.clear()
+
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.error(f"❌ Failed to close Anthropic client: {e}")
+
+
+def get_evaluation_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore capping concurrent evaluation calls (created inside the running loop)"""
+    global _evaluation_semaphore
+    if _evaluation_semaphore is None:
+        limit = MAX_CONCURRENT_EVALUATIONS
+        value = os.getenv("ANTHROPIC_MAX_INFLIGHT")
+        if value:
+            try:
+                limit = max(1, int(value))
+            except ValueError:
+                logger.warning(
+                    f"⚠️ Invalid ANTHROPIC_MAX_INFLIGHT={value!r} - "
+                    f"using {MAX_CONCURRENT_EVALUATIONS}"
+                )
+        _evaluation_semaphore = asyncio.Semaphore(limit)
+    return _evaluation_semaphore
+
 
 class InterviewEvaluator:
     """
@@ -104,15 +174,21 @@ Respond ONLY with valid JSON in this exact format:
     "confidence_tone": 0.0-1.0
 }}"""
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-5"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-sonnet-4-5",
+        client: Optional[AsyncAnthropic] = None
+    ):
         """
         Initialize evaluator
 
         Args:
             api_key: Anthropic API key
             model: Claude model to use
+            client: Anthropic client to use (defaults to the shared client for api_key)
         """
-        self.client = Anthropic(api_key=api_key)
+        self.client = client or get_anthropic_client(api_key)
         self.model = model
 
         logger.info(f"✅ InterviewEvaluator initialized with model: {model}")
@@ -136,29 +212,41 @@ Respond ONLY with valid JSON in this exact format:
             # Format conversation for LLM
             conversation_text = window.get_text(include_speakers=True)
 
-            # Format themes list
-            themes_list = "\n".join([f"{tag}: {desc}" for tag, desc in QUANT_THEMES.items()])
-
-            # Build prompt
-            prompt = self.EVALUATION_PROMPT.format(
-                themes_list=themes_list,
-                conversation=conversation_text
-            )
-
-            # Call Claude API
-            logger.debug("📡 Calling Claude API...")
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
-
-            # Extract response text
-            response_text = response.content[0].text.strip()
-            logger.debug(f"📝 Claude response: {response_text[:100]}...")
+            # Reuse the previous response for an identical window
+            cache_key = hashlib.blake2b(
+                f"{self.model}\n{conversation_text}".encode(), digest_size=16
+            ).hexdigest()
+            cached = _response_cache.get(cache_key)
+            if cached is not None and cached[0] <= time.monotonic():
+                del _response_cache[cache_key]
+                cached = None
+
+            if cached is not None:
+                _response_cache.move_to_end(cache_key)
+                response_text = cached[1]
+                logger.debug("♻️ Reusing cached Claude response")
+            else:
+                # Build prompt
+                prompt = self.EVALUATION_PROMPT.format(
+                    themes_list=THEMES_LIST,
+                    conversation=conversation_text
+                )
+
+                # Call Claude API (bounded concurrency across rooms)
+                logger.debug("📡 Calling Claude API...")
+                async with get_evaluation_semaphore():
+                    response = await self.client.messages.create(
+                        model=self.model,
+                        max_tokens=1024,
+                        messages=[{
+                            "role": "user",
+                            "content": prompt
+                        }]
+                    )
+
+                # Extract response text
+                response_text = response.content[0].text.strip()
+                logger.debug(f"📝 Claude response: {response_text[:100]}...")
 
             # Parse JSON response
             evaluation_data = self._parse_response(response_text)
@@ -192,6 +280,15 @@ Respond ONLY with valid JSON in this exact format:
                 raw_llm_response=response_text
             )
 
+            # Only cache responses that produced a valid EvaluationResult
+            if cached is None:
+                _response_cache[cache_key] = (
+                    time.monotonic() + RESPONSE_CACHE_TTL_SECONDS,
+                    response_text
+                )
+                if len(_response_cache) > MAX_CACHED_RESPONSES:
+                    _response_cache.popitem(last=False)
+
             logger.info(
                 f"✅ Evaluation complete: "
                 f"relevance={result.subject_relevance.value}, "
@@ -0,0 +1,100 @@
+"""
+Room Stats - Incremental analytics aggregation for interview rooms
+"""
+
+from typing import Dict, Set
+
+
+# Topics reported in the analytics topic coverage (ordered for the response)
+ALL_TOPICS = (
+    "CV_TECHNIQUES", "REGULARIZATION", "FEATURE_SELECTION",
+    "STATIONARITY", "TIME_SERIES_MODELS", "OPTIMIZATION_PYTHON",
+    "LOOKAHEAD_BIAS", "DATA_PIPELINE", "BEHAVIORAL_PRESSURE",
+    "BEHAVIORAL_TEAMWORK", "EXTRA"
+)
+ALL_TOPICS_SET = frozenset(ALL_TOPICS)
+
+# Numeric scale used to average interviewer tone
+TONE_VALUES = {"harsh": 0, "neutral": 1, "encouraging": 2}
+
+
+class RoomStats:
+    """
+    Running aggregates over the evaluations of a room
+
+    Updated once per evaluation so that analytics requests only read
+    the counters instead of rescanning every stored evaluation.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.difficulty_counts: Dict[str, int] = {"easy": 0, "medium": 0, "hard": 0, "unknown": 0}
+        self.topic_set: Set[str] = set()
+        self.tone_sum = 0
+        self.tone_n = 0
+        self.red_flags = 0
+        self.conf_subject_sum = 0.0
+        self.conf_difficulty_sum = 0.0
+        self.conf_tone_sum = 0.0
+
+    def update(self, evaluation: dict) -> None:
+        """
+        Fold a new evaluation into the running aggregates
+
+        Args:
+            evaluation: Evaluation event data
+        """
+        self.total += 1
+
+        difficulty = evaluation.get("question_difficulty", "unknown").lower()
+        self.difficulty_counts[difficulty] = self.difficulty_counts.get(difficulty, 0) + 1
+
+        self.topic_set.update(evaluation.get("key_topics", []))
+
+        tone = evaluation.get("interviewer_tone", "neutral").lower()
+        if tone in TONE_VALUES:
+            self.tone_sum += TONE_VALUES[tone]
+            self.tone_n += 1
+
+        self.red_flags += len(evaluation.get("flags", []))
+        # Count off-topic as red flag
+        if evaluation.get("subject_relevance") == "off_topic":
+            self.red_flags += 1
+
+        self.conf_subject_sum += evaluation.get("confidence_subject", 0)
+        self.conf_difficulty_sum += evaluation.get("confidence_difficulty", 0)
+        self.conf_tone_sum += evaluation.get("confidence_tone", 0)
+
+    def difficulty_distribution(self) -> Dict[str, float]:
+        """Percentage of evaluations per difficulty level"""
+        total = self.total
+        return {
+            k: (v / total * 100) if total > 0 else 0
+            for k, v in self.difficulty_counts.items()
+        }
+
+    def topic_coverage(self) -> Dict[str, bool]:
+        """Whether each tracked topic has been discussed"""
+        covered = ALL_TOPICS_SET & self.topic_set
+        return {
+            topic: topic in covered
+            for topic in ALL_TOPICS
+        }
+
+    def average_tone(self) -> str:
+        """Average interviewer tone bucketed back to a label"""
+        avg_tone_score = self.tone_sum / self.tone_n if self.tone_n else 1
+        if avg_tone_score < 0.5:
+            return "harsh"
+        if avg_tone_score > 1.5:
+            return "encouraging"
+        return "neutral"
+
+    def average_confidence(self) -> Dict[str, float]:
+        """Average confidence scores across evaluations"""
+        total = self.total
+        return {
+            "subject": self.conf_subject_sum / total,
+            "difficulty": self.conf_difficulty_sum / total,
+            "tone": self.conf_tone_sum / total,
+        }
@@ -11,6 +11,8 @@ import asyncio
 import logging
 import os
 import json
+import textwrap
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
@@ -20,6 +22,11 @@ from room_manager import RoomManager
 from transcript_buffer import TranscriptBuffer
 from interview_evaluator import InterviewEvaluator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,7 +44,7 @@ class AlertThrottler:
     """
     def __init__(self):
         self.evaluation_history = []  # Store recent evaluations
-        self.interview_start_time = None  # Track interview start
+        self.interview_start_time = None  # Track interview start (monotonic seconds)
         self.cooloff_period_seconds = 60  # 1 minute cool-off
 
     def should_trigger_alert(self, evaluation: dict, alert_type: str) -> bool:
@@ -53,7 +60,7 @@ class AlertThrottler:
         """
         # Initialize interview start time on first evaluation
         if self.interview_start_time is None:
-            self.interview_start_time = datetime.now()
+            self.interview_start_time = time.monotonic()
 
         # Add current evaluation to history
         self.evaluation_history.append(evaluation)
@@ -63,7 +70,7 @@ class AlertThrottler:
             self.evaluation_history = self.evaluation_history[-6:]
 
         # Cool-off period: suppress all alerts during first 1 minute
-        elapsed_seconds = (datetime.now() - self.interview_start_time).total_seconds()
+        elapsed_seconds = time.monotonic() - self.interview_start_time
         if elapsed_seconds < self.cooloff_period_seconds:
             return False
 
@@ -119,8 +126,10 @@ class TranscriptAndEvaluationStorage:
         if not transcript.is_final:
             return
 
+        timestamp = transcript.timestamp or datetime.now()
+
         transcript_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp.isoformat(),
             "speaker": transcript.speaker,
             "text": transcript.text,
             "is_final": transcript.is_final
@@ -136,14 +145,31 @@ class TranscriptAndEvaluationStorage:
         self._save_evaluations_json()
         self._save_evaluation_text(evaluation)
 
+    # Closing brackets of transcripts.json, overwritten on each append
+    TRANSCRIPTS_JSON_TAIL = "\n  ]\n}"
+
     def _save_transcripts_json(self):
-        """Save all transcripts to JSON file"""
-        with open(self.json_file, 'w') as f:
-            json.dump({
+        """
+        Append the latest transcript to the JSON file
+
+        The file keeps the same indented layout as a full json.dump, but only the
+        closing brackets are rewritten so each append is O(1) instead of O(N).
+        """
+        entry = textwrap.indent(json.dumps(self.transcripts[-1], indent=2), "    ")
+
+        if len(self.transcripts) == 1:
+            header = json.dumps({
                 "room": self.room_name,
-                "session_start": self.transcripts[0]["timestamp"] if self.transcripts else None,
-                "transcripts": self.transcripts
-            }, f, indent=2)
+                "session_start": self.transcripts[0]["timestamp"]
+            }, indent=2)[:-2]
+            with open(self.json_file, 'w') as f:
+                f.write(f'{header},\n  "transcripts": [\n{entry}{self.TRANSCRIPTS_JSON_TAIL}')
+            return
+
+        with open(self.json_file, 'rb+') as f:
+            f.seek(-len(self.TRANSCRIPTS_JSON_TAIL), os.SEEK_END)
+            f.write(f",\n{entry}{self.TRANSCRIPTS_JSON_TAIL}".encode())
+            f.truncate()
 
     def _save_transcript_text(self, transcript_data: dict):
         """Append transcript to human-readable text file"""
@@ -154,12 +180,20 @@ class TranscriptAndEvaluationStorage:
 
     def _save_evaluations_json(self):
         """Save all evaluations to JSON file"""
+        data = {
+            "room": self.room_name,
+            "total_evaluations": len(self.evaluations),
+            "evaluations": self.evaluations
+        }
+
+        # The whole file is rewritten per evaluation, so encode it with orjson when available
+        if orjson is not None:
+            with open(self.evaluations_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+
         with open(self.evaluations_file, 'w') as f:
-            json.dump({
-                "room": self.room_name,
-                "total_evaluations": len(self.evaluations),
-                "evaluations": self.evaluations
-            }, f, indent=2)
+            json.dump(data, f, indent=2)
 
     def _save_evaluation_text(self, evaluation):
         """Append evaluation to human-readable text file"""
@@ -271,7 +305,7 @@ async def run_agent(
 
     # Track speaker statistics for interviewer dominance detection
     speaker_stats = {
-        'last_check_time': None,
+        'last_check_time': None,  # time.monotonic() of the last dominance check
         'transcript_history': []  # List of (timestamp, speaker, text_length)
     }
 
@@ -280,8 +314,6 @@ async def run_agent(
         Check if interviewer speaks >70% in last 60 seconds.
         Returns: (is_dominant, interviewer_percentage)
         """
-        import time
-
         current_time = datetime.now()
         cutoff_time = current_time - timedelta(seconds=60)
 
@@ -323,12 +355,12 @@ async def run_agent(
                 filtered_evaluation = evaluation.to_dict().copy()
 
                 # Check interviewer dominance (every minute)
-                current_time = datetime.now()
+                current_time = time.monotonic()
 
                 # Check dominance every 60 seconds
                 should_check_dominance = (
                     speaker_stats['last_check_time'] is None or
-                    (current_time - speaker_stats['last_check_time']).total_seconds() >= 60
+                    current_time - speaker_stats['last_check_time'] >= 60
                 )
 
                 if should_check_dominance:
@@ -399,18 +431,24 @@ async def run_agent(
             if transcript.is_final:
                 print(f"{speaker_emoji} [{transcript.speaker.upper()}] {marker} {transcript.text}")
 
+                # Single clock read shared by storage, stats, SSE event and buffer
+                if transcript.timestamp is None:
+                    transcript.timestamp = datetime.now()
+                now = transcript.timestamp
+                now_iso = now.isoformat()
+
                 # Save final transcript
                 storage.add_transcript(transcript)
 
                 # Track transcript for speaker dominance detection
                 word_count = len(transcript.text.split())
                 speaker_stats['transcript_history'].append((
-                    datetime.now(),
+                    now,
                     transcript.speaker,
                     word_count
                 ))
                 # Keep only last 2 minutes of transcripts for memory efficiency
-                cutoff = datetime.now() - timedelta(seconds=120)
+                cutoff = now - timedelta(seconds=120)
                 speaker_stats['transcript_history'] = [
                     t for t in speaker_stats['transcript_history']
                     if t[0] >= cutoff
@@ -421,7 +459,7 @@ async def run_agent(
                     await event_callback({
                         "type": "transcript",
                         "data": {
-                            "timestamp": datetime.now().isoformat(),
+                            "timestamp": now_iso,
                             "speaker": transcript.speaker,
                             "text": transcript.text,
                             "is_final": transcript.is_final
@@ -14,19 +14,31 @@ import asyncio
 import json
 import logging
 import os
-from collections import defaultdict
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
 from datetime import datetime
+from itertools import count, islice
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
-from sse_starlette.sse import EventSourceResponse
+from pydantic_core import to_json
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 
 from room_manager import RoomManager
 from agent_manager import AgentManager
+from event_batcher import RoomBatcher
+from interview_evaluator import close_anthropic_clients
+from room_stats import RoomStats
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 load_dotenv()
 
@@ -37,11 +49,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def dumps(obj) -> str:
+    """Encode an SSE payload as JSON (orjson when available, else pydantic-core)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return to_json(obj).decode()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: cleanup of agents, batchers and the Anthropic client on shutdown"""
+    yield
+
+    if agent_manager:
+        await agent_manager.cleanup()
+
+    await close_anthropic_clients()
+
+    # Copy: a closing agent's on_exit callback may remove its batcher meanwhile
+    for batcher in list(room_batchers.values()):
+        await batcher.close()
+    room_batchers.clear()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="QuantCoach LiveKit API",
     description="API for managing LiveKit interview rooms with audio transcription",
     version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
 )
 
 # Add CORS middleware
@@ -86,18 +124,110 @@ if room_manager:
         logger.error(f"❌ Failed to initialize AgentManager: {e}")
         agent_manager = None
 
-# Event queues for SSE streaming: room_name -> asyncio.Queue
-event_queues: Dict[str, List[asyncio.Queue]] = defaultdict(list)
+# SSE keepalive ping interval and per-send timeout (seconds)
+SSE_PING_SECONDS = 15
+SSE_SEND_TIMEOUT_SECONDS = 30
 
-# Session data storage: room_name -> {transcripts: [], evaluations: []}
-session_data: Dict[str, dict] = defaultdict(lambda: {"transcripts": [], "evaluations": []})
+# Event queues for SSE streaming: room_name -> {client_id: asyncio.Queue}
+event_queues: Dict[str, Dict[int, asyncio.Queue]] = defaultdict(dict)
+sse_client_ids = count()
 
+# Event batchers: room_name -> RoomBatcher
+room_batchers: Dict[str, RoomBatcher] = {}
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    if agent_manager:
-        await agent_manager.cleanup()
+# Number of recent transcripts/evaluations kept in memory per room for SSE replay.
+# Older entries are spilled to an append-only JSONL file under SPILL_DIR.
+SESSION_BACKLOG_SIZE = 500
+SPILL_DIR = Path("transcripts") / "spill"
+
+# Session data storage: room_name -> {transcripts: deque, evaluations: deque, ...}
+session_data: Dict[str, dict] = defaultdict(lambda: {
+    "transcripts": deque(maxlen=SESSION_BACKLOG_SIZE),
+    "evaluations": deque(maxlen=SESSION_BACKLOG_SIZE),
+    "transcripts_file": None,
+    "evaluations_file": None,
+    "total_transcripts": 0,
+    "last_seq": 0,
+})
+
+# Running analytics aggregates: room_name -> RoomStats
+room_stats: Dict[str, RoomStats] = defaultdict(RoomStats)
+
+# Maximum number of rooms whose session data and stats are kept in memory.
+# Beyond this, the oldest finished rooms (agent not running, no SSE clients) are dropped.
+MAX_RETAINED_ROOMS = 200
+
+
+def is_agent_running(room_name: str) -> bool:
+    """Whether the room's agent is still running"""
+    if not agent_manager:
+        return False
+    status = agent_manager.get_agent_status(room_name)
+    return status is not None and status["status"] == "running"
+
+
+def evict_stale_rooms() -> None:
+    """Drop in-memory state of the oldest finished rooms once MAX_RETAINED_ROOMS is exceeded"""
+    excess = len(session_data) - MAX_RETAINED_ROOMS
+    if excess <= 0:
+        return
+
+    # Dicts keep insertion order, so the first rooms are the oldest
+    stale = [
+        room_name for room_name in session_data
+        if not is_agent_running(room_name) and not event_queues.get(room_name)
+    ][:excess]
+
+    for room_name in stale:
+        session_data.pop(room_name, None)
+        room_stats.pop(room_name, None)
+        event_queues.pop(room_name, None)
+
+    if stale:
+        logger.info(f"🧹 Evicted session data for {len(stale)} finished room(s)")
+
+
+def store_session_event(room_name: str, kind: str, event_data: dict) -> int:
+    """
+    Append an event to the room backlog, spilling the oldest entry to disk when full
+
+    Args:
+        room_name: Name of the room
+        kind: "transcripts" or "evaluations"
+        event_data: Event payload to store
+
+    Returns:
+        Sequence number of the stored event within the room
+    """
+    data = session_data[room_name]
+    backlog = data[kind]
+
+    if len(backlog) == backlog.maxlen:
+        spill_file = data[f"{kind}_file"]
+        mode = "a"
+        if spill_file is None:
+            # One file per session, so a reused room name never replays an older session
+            SPILL_DIR.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            spill_file = SPILL_DIR / f"{room_name}_{timestamp}_{kind}.jsonl"
+            data[f"{kind}_file"] = spill_file
+            mode = "w"
+
+        with open(spill_file, mode) as f:
+            f.write(dumps(backlog[0]) + "\n")
+
+    backlog.append(event_data)
+
+    data["last_seq"] += 1
+    return data["last_seq"]
+
+
+def is_newer_than(entry: dict, since: float) -> bool:
+    """Whether a stored event's ISO timestamp is after the given unix timestamp"""
+    timestamp = entry.get("timestamp")
+    if timestamp is None:
+        return True
+    return datetime.fromisoformat(timestamp).timestamp() > since
 
 
 # Pydantic models for request/response
@@ -145,6 +275,10 @@ class ParticipantInfo(BaseModel):
     state: str
 
 
+class BatchAnalyticsRequest(BaseModel):
+    room_names: list[str]
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -189,8 +323,12 @@ async def create_interview_room(request: CreateRoomRequest):
         )
 
     try:
+        # Single clock read shared by the room name and participant identities
+        now = datetime.now()
+        ts = now.timestamp()
+
         # Generate room name if not provided
-        room_name = request.room_name or f"interview-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        room_name = request.room_name or f"interview-{now.strftime('%Y%m%d-%H%M%S')}"
 
         logger.info(f"Creating room: {room_name}")
 
@@ -202,21 +340,21 @@ async def create_interview_room(request: CreateRoomRequest):
         # Generate tokens for all participant types
         interviewer_token = room_manager.generate_token(
             room_name=room_name,
-            participant_identity=f"interviewer-{datetime.now().timestamp()}",
+            participant_identity=f"interviewer-{ts}",
             participant_name="Interviewer",
             metadata='{"role": "interviewer"}',
         )
 
         candidate_token = room_manager.generate_token(
             room_name=room_name,
-            participant_identity=f"candidate-{datetime.now().timestamp()}",
+            participant_identity=f"candidate-{ts}",
             participant_name="Candidate",
             metadata='{"role": "candidate"}',
         )
 
         agent_token = room_manager.generate_token(
             room_name=room_name,
-            participant_identity=f"agent-{datetime.now().timestamp()}",
+            participant_identity=f"agent-{ts}",
             participant_name="Analysis Agent",
             metadata='{"role": "agent", "type": "analyzer"}',
         )
@@ -225,36 +363,51 @@ async def create_interview_room(request: CreateRoomRequest):
 
         # Auto-start agent if AgentManager is available
         if agent_manager:
+            evict_stale_rooms()
+
+            created_batcher = room_name not in room_batchers
+            if created_batcher:
+                room_batchers[room_name] = RoomBatcher(room_name, event_queues)
+            batcher = room_batchers[room_name]
+
             async def event_callback(event: dict):
                 """Callback to publish events to SSE streams"""
-                event_type = event.get("type")
-                event_data = event.get("data")
+                event_type = event.get("type", "message")
+                event_data = event.get("data", {})
 
                 # Store events in session data
+                seq = None
                 if event_type == "transcript":
-                    session_data[room_name]["transcripts"].append(event_data)
+                    seq = store_session_event(room_name, "transcripts", event_data)
+                    session_data[room_name]["total_transcripts"] += 1
                 elif event_type == "evaluation":
-                    session_data[room_name]["evaluations"].append(event_data)
+                    seq = store_session_event(room_name, "evaluations", event_data)
+                    room_stats[room_name].update(event_data)
+
+                # Encode once, then publish to all subscribers (batched)
+                batcher.publish(event_type, dumps(event_data), seq)
 
-                # Publish to all subscribers
-                if room_name in event_queues:
-                    for queue in event_queues[room_name]:
-                        try:
-                            await queue.put(event)
-                        except Exception:
-                            pass  # Queue might be closed
+            async def close_batcher():
+                """Flush and stop the room batcher once the agent has exited"""
+                if room_batchers.get(room_name) is batcher:
+                    del room_batchers[room_name]
+                await batcher.close()
 
             # Start agent
             agent_started = await agent_manager.start_agent(
                 room_name=room_name,
                 livekit_token=agent_token,
-                event_callback=event_callback
+                event_callback=event_callback,
+                on_exit=close_batcher
             )
 
             if agent_started:
                 logger.info(f"✅ Agent auto-started for room: {room_name}")
             else:
                 logger.warning(f"⚠️ Failed to auto-start agent for room: {room_name}")
+                # No agent will publish to (or close) a batcher created for it
+                if created_batcher:
+                    await close_batcher()
 
         return CreateRoomResponse(
             sid=room["sid"],
@@ -381,6 +534,10 @@ async def delete_room(room_name: str):
         if agent_manager:
             await agent_manager.stop_agent(room_name)
 
+        batcher = room_batchers.pop(room_name, None)
+        if batcher:
+            await batcher.close()
+
         await room_manager.delete_room(room_name)
         logger.info(f"✅ Room deleted: {room_name}")
         return {"status": "success", "message": f"Room {room_name} deleted"}
@@ -390,75 +547,141 @@ async def delete_room(room_name: str):
 
 
 @app.get("/rooms/{room_name}/stream")
-async def stream_room_events(room_name: str):
+async def stream_room_events(
+    room_name: str,
+    full_history: bool = False,
+    since: Optional[float] = None,
+    live: bool = False
+):
     """
     Server-Sent Events stream for real-time transcripts and evaluations
 
+    On connect, the recent backlog kept in memory is replayed. Query params:
+    - full_history=true: also replay entries already spilled to disk
+    - since=<unix ts>: only replay entries newer than this timestamp
+    - live=true: skip the replay and only stream new events
+
     Streams:
     - transcript events: {type: "transcript", data: {...}}
     - evaluation events: {type: "evaluation", data: {...}}
     - status events: {type: "status", data: {...}}
     """
     # Create a new queue for this client
+    client_id = next(sse_client_ids)
     client_queue = asyncio.Queue()
-    event_queues[room_name].append(client_queue)
+    event_queues[room_name][client_id] = client_queue
 
     logger.info(f"📡 New SSE client connected to room: {room_name}")
 
     async def event_generator():
         try:
             # Send connection confirmation
-            yield {
-                "event": "connected",
-                "data": json.dumps({
+            yield ServerSentEvent(
+                event="connected",
+                data=dumps({
                     "room": room_name,
                     "timestamp": datetime.now().isoformat()
                 })
-            }
+            )
 
             # Send any existing data
-            if room_name in session_data:
+            replayed_seq = 0
+            if not live and room_name in session_data:
                 data = session_data[room_name]
 
-                # Send existing transcripts
-                for transcript in data["transcripts"]:
-                    yield {
-                        "event": "transcript",
-                        "data": json.dumps(transcript)
-                    }
-
-                # Send existing evaluations
-                for evaluation in data["evaluations"]:
-                    yield {
-                        "event": "evaluation",
-                        "data": json.dumps(evaluation)
-                    }
-
-            # Stream new events
+                # Snapshot the backlog in one step: queued live events up to
+                # replayed_seq are part of the snapshot and are skipped below
+                replayed_seq = data["last_seq"]
+                snapshots = []
+                for kind, event_type in (("transcripts", "transcript"), ("evaluations", "evaluation")):
+                    spill_file = data[f"{kind}_file"] if full_history else None
+                    spill_size = spill_file.stat().st_size if spill_file is not None else 0
+                    snapshots.append((event_type, spill_file, spill_size, list(data[kind])))
+
+                for event_type, spill_file, spill_size, entries in snapshots:
+                    # Older entries spilled to disk (already JSON-encoded, one per line),
+                    # read up to the snapshot size so later spills are not replayed twice
+                    if spill_file is not None:
+                        with open(spill_file, "rb") as f:
+                            remaining = spill_size
+                            for raw_line in f:
+                                if remaining <= 0:
+                                    break
+                                remaining -= len(raw_line)
+                                line = raw_line.decode().rstrip("\n")
+                                if since is None or is_newer_than(json.loads(line), since):
+                                    yield ServerSentEvent(event=event_type, data=line)
+
+                    for entry in entries:
+                        if since is None or is_newer_than(entry, since):
+                            yield ServerSentEvent(event=event_type, data=dumps(entry))
+
+            # Stream new events (batches of pre-encoded payloads)
             while True:
-                event = await client_queue.get()
+                batch = await client_queue.get()
 
-                if event is None:  # Sentinel to stop
+                if batch is None:  # Sentinel to stop
                     break
 
-                event_type = event.get("type", "message")
-                event_data = event.get("data", {})
-
-                yield {
-                    "event": event_type,
-                    "data": json.dumps(event_data)
-                }
+                for event_type, payload, seq in batch:
+                    if seq is not None and seq <= replayed_seq:
+                        continue
+                    yield ServerSentEvent(event=event_type, data=payload)
 
         except asyncio.CancelledError:
             logger.info(f"📡 SSE client disconnected from room: {room_name}")
         finally:
             # Remove queue from subscribers
-            if room_name in event_queues:
-                event_queues[room_name].remove(client_queue)
-                if not event_queues[room_name]:
-                    del event_queues[room_name]
+            queues = event_queues.get(room_name)
+            if queues is not None:
+                queues.pop(client_id, None)
+                if not queues:
+                    event_queues.pop(room_name, None)
+
+    return EventSourceResponse(
+        event_generator(),
+        ping=SSE_PING_SECONDS,
+        send_timeout=SSE_SEND_TIMEOUT_SECONDS,
+    )
+
+
+def build_room_analytics(room_name: str) -> dict:
+    """
+    Build the analytics payload for a room that has session data
+
+    Args:
+        room_name: Name of the room (must be present in session_data)
+
+    Returns:
+        Analytics dictionary as served by the analytics endpoints
+    """
+    data = session_data[room_name]
+    evaluations = data["evaluations"]
+
+    if not evaluations:
+        return {
+            "room": room_name,
+            "total_evaluations": 0,
+            "difficulty_distribution": {},
+            "topic_coverage": {},
+            "average_tone": None,
+            "red_flag_count": 0,
+            "average_confidence": {}
+        }
+
+    stats = room_stats[room_name]
 
-    return EventSourceResponse(event_generator())
+    return {
+        "room": room_name,
+        "total_evaluations": stats.total,
+        "total_transcripts": data["total_transcripts"],
+        "difficulty_distribution": stats.difficulty_distribution(),
+        "topic_coverage": stats.topic_coverage(),
+        "average_tone": stats.average_tone(),
+        "red_flag_count": stats.red_flags,
+        "average_confidence": stats.average_confidence(),
+        "evaluations_sample": list(islice(evaluations, max(0, len(evaluations) - 5), None))
+    }
 
 
 @app.get("/rooms/{room_name}/analytics")
@@ -479,93 +702,28 @@ async def get_room_analytics(room_name: str):
             detail=f"No session data found for room: {room_name}"
         )
 
-    data = session_data[room_name]
-    evaluations = data["evaluations"]
+    return build_room_analytics(room_name)
 
-    if not evaluations:
-        return {
-            "room": room_name,
-            "total_evaluations": 0,
-            "difficulty_distribution": {},
-            "topic_coverage": {},
-            "average_tone": None,
-            "red_flag_count": 0,
-            "average_confidence": {}
-        }
-
-    # Calculate difficulty distribution
-    difficulty_counts = {"easy": 0, "medium": 0, "hard": 0, "unknown": 0}
-    for eval in evaluations:
-        difficulty = eval.get("question_difficulty", "unknown").lower()
-        difficulty_counts[difficulty] = difficulty_counts.get(difficulty, 0) + 1
 
-    total = len(evaluations)
-    difficulty_distribution = {
-        k: (v / total * 100) if total > 0 else 0
-        for k, v in difficulty_counts.items()
-    }
+@app.post("/rooms/analytics/batch")
+async def get_rooms_analytics_batch(request: BatchAnalyticsRequest):
+    """
+    Get aggregated analytics for several rooms in one request
 
-    # Calculate topic coverage
-    all_topics = [
-        "CV_TECHNIQUES", "REGULARIZATION", "FEATURE_SELECTION",
-        "STATIONARITY", "TIME_SERIES_MODELS", "OPTIMIZATION_PYTHON",
-        "LOOKAHEAD_BIAS", "DATA_PIPELINE", "BEHAVIORAL_PRESSURE",
-        "BEHAVIORAL_TEAMWORK", "EXTRA"
-    ]
-
-    topics_covered = set()
-    for eval in evaluations:
-        topics = eval.get("key_topics", [])
-        topics_covered.update(topics)
-
-    topic_coverage = {
-        topic: topic in topics_covered
-        for topic in all_topics
-    }
+    Returns:
+    - rooms: room_name -> analytics (same shape as /rooms/{room_name}/analytics)
+    - missing: requested rooms without session data
+    """
+    rooms = {}
+    missing = []
 
-    # Calculate average tone
-    tone_values = {"harsh": 0, "neutral": 1, "encouraging": 2}
-    tone_scores = []
-    for eval in evaluations:
-        tone = eval.get("interviewer_tone", "neutral").lower()
-        if tone in tone_values:
-            tone_scores.append(tone_values[tone])
-
-    avg_tone_score = sum(tone_scores) / len(tone_scores) if tone_scores else 1
-    avg_tone = "neutral"
-    if avg_tone_score < 0.5:
-        avg_tone = "harsh"
-    elif avg_tone_score > 1.5:
-        avg_tone = "encouraging"
-
-    # Count red flags
-    red_flag_count = 0
-    for eval in evaluations:
-        flags = eval.get("flags", [])
-        red_flag_count += len(flags)
-
-        # Count off-topic as red flag
-        if eval.get("subject_relevance") == "off_topic":
-            red_flag_count += 1
-
-    # Calculate average confidence
-    avg_confidence = {
-        "subject": sum(e.get("confidence_subject", 0) for e in evaluations) / total,
-        "difficulty": sum(e.get("confidence_difficulty", 0) for e in evaluations) / total,
-        "tone": sum(e.get("confidence_tone", 0) for e in evaluations) / total,
-    }
+    for room_name in dict.fromkeys(request.room_names):
+        if room_name in session_data:
+            rooms[room_name] = build_room_analytics(room_name)
+        else:
+            missing.append(room_name)
 
-    return {
-        "room": room_name,
-        "total_evaluations": len(evaluations),
-        "total_transcripts": len(data["transcripts"]),
-        "difficulty_distribution": difficulty_distribution,
-        "topic_coverage": topic_coverage,
-        "average_tone": avg_tone,
-        "red_flag_count": red_flag_count,
-        "average_confidence": avg_confidence,
-        "evaluations_sample": evaluations[-5:] if len(evaluations) > 5 else evaluations
-    }
+    return {"rooms": rooms, "missing": missing}
 
 
 @app.get("/rooms/{room_name}/status")